@@ -22,11 +22,13 @@
 __all__ = [
     "MAX_POSITION",
     "MAX_TEMPERATURE",
+    "NAMES_ENABLED_STATE",
     "NUM_DRIVE_SHUTTER",
     "SUBSYSTEMS",
 ]
 
 from lsst.ts.mtdomecom import APSCS_NUM_MOTORS_PER_SHUTTER, APSCS_NUM_SHUTTERS
+from lsst.ts.xml.enums import MTDome
 
 # Maximum position in degree
 MAX_POSITION = 360.0
@@ -34,6 +36,9 @@ MAX_POSITION = 360.0
 # Maximum temperature in degree Celsius
 MAX_TEMPERATURE = 10.0
 
+# Name of each enabled state
+NAMES_ENABLED_STATE = {state.value: state.name for state in MTDome.EnabledState}
+
 # Number of the aperture shutter drives
 NUM_DRIVE_SHUTTER = APSCS_NUM_MOTORS_PER_SHUTTER * APSCS_NUM_SHUTTERS
 
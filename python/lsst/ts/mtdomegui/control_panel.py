@@ -21,6 +21,7 @@
 
 __all__ = ["ControlPanel"]
 
+import typing
 from functools import partial
 
 from PySide6.QtGui import QPalette
@@ -34,13 +35,25 @@ from lsst.ts.guitool import (
     set_button,
     update_button_color,
 )
+from lsst.ts.mtdomecom import MON_NUM_SENSORS
 from lsst.ts.xml.enums import MTDome
 
+from .constants import NAMES_ENABLED_STATE
 from .model import Model
 from .signals import SignalInterlock, SignalState
 from .tab import TabBrake, TabInterlock
 from .utils import add_empty_row_to_form_layout
 
+# Names of the enum members indexed by their values. This avoids to
+# construct the enum instance in every update of the label.
+_NAMES_POWER_MODE = {mode.value: mode.name for mode in MTDome.PowerManagementMode}
+_NAMES_CONTROL_MODE = {mode.value: mode.name for mode in MTDome.ControlMode}
+_NAME_ON = MTDome.OnOff.ON.name
+_NAME_OFF = MTDome.OnOff.OFF.name
+
+# Bitmask of each brake in the order of `MTDome.Brake`.
+_BRAKE_MASKS = [1 << brake.value for brake in MTDome.Brake]
+
 
 class ControlPanel(QWidget):
     """Control panel.
@@ -87,6 +100,13 @@ class ControlPanel(QWidget):
             "control_mode": create_label(),
         }
 
+        # Interlocks shown in the interlock table and button.
+        self._interlocks = [False] * MON_NUM_SENSORS
+        self._is_interlock_triggered: bool | None = None
+
+        # Brake engaged bitmask shown in the brake table.
+        self._brake_engaged = 0
+
         self.setLayout(self._create_layout())
 
         signals = self.model.reporter.signals
@@ -150,19 +170,26 @@ class ControlPanel(QWidget):
         signal.locking_pins_engaged.connect(partial(self._callback_update_label, "locking_pin"))
 
     @asyncSlot()
-    async def _callback_interlock(self, interlocks: list[bool]) -> None:
+    async def _callback_interlock(self, interlocks: typing.Sequence[bool]) -> None:
         """Callback to update the interlock.
 
         Parameters
         ----------
-        interlocks : `list` [`bool`]
+        interlocks : `list` or `tuple` [`bool`]
             Status of the interlocks. True is latched. Otherwise, False.
         """
 
-        for index, is_triggered in enumerate(interlocks):
-            self._tab_interlock.update_interlock_status(index, is_triggered)
+        # Only update the interlocks that have been changed
+        for index, (is_triggered, was_triggered) in enumerate(zip(interlocks, self._interlocks)):
+            if is_triggered != was_triggered:
+                self._tab_interlock.update_interlock_status(index, is_triggered)
 
-        self._update_button_interlock(any(interlocks))
+        self._interlocks = list(interlocks)
+
+        is_triggered_any = any(interlocks)
+        if is_triggered_any != self._is_interlock_triggered:
+            self._is_interlock_triggered = is_triggered_any
+            self._update_button_interlock(is_triggered_any)
 
     def _update_button_interlock(self, is_triggered: bool) -> None:
         """Update the button of interlock.
@@ -173,7 +200,7 @@ class ControlPanel(QWidget):
             Is triggered or not.
         """
 
-        name = MTDome.OnOff.ON.name if is_triggered else MTDome.OnOff.OFF.name
+        name = _NAME_ON if is_triggered else _NAME_OFF
         self._button_interlock.setText(name)
 
         button_status = ButtonStatus.Error if is_triggered else ButtonStatus.Normal
@@ -184,7 +211,7 @@ class ControlPanel(QWidget):
         self,
         field: str,
         value: int,
-        enum: MTDome.EnabledState | MTDome.PowerManagementMode | MTDome.ControlMode | None = None,
+        names: dict[int, str] | None = None,
     ) -> None:
         """Callback to update the label.
 
@@ -194,15 +221,15 @@ class ControlPanel(QWidget):
             Field.
         value : `int`
             Value.
-        enum: `MTDome.EnabledState` or `MTDome.PowerManagementMode` or
-        `MTDome.ControlMode` or None
-            Enum to convert the value. If None, the hex value will be shown.
+        names : `dict` [`int`, `str`] or None, optional
+            Names of the enum members indexed by their values to convert the
+            value. If None, the hex value will be shown. (the default is None)
         """
 
-        if enum is None:
+        if names is None:
             self._labels[field].setText(hex(value))
         else:
-            self._labels[field].setText(enum(value).name)
+            self._labels[field].setText(names[value])
 
     def _set_signal_state(self, signal: SignalState) -> None:
         """Set the state signal.
@@ -214,56 +241,18 @@ class ControlPanel(QWidget):
         """
 
         signal.brake_engaged.connect(self._callback_update_brake_engaged)
-        signal.azimuth_axis.connect(
-            partial(self._callback_update_label, "azimuth_axis", enum=MTDome.EnabledState)
-        )
-        signal.elevation_axis.connect(
-            partial(self._callback_update_label, "elevation_axis", enum=MTDome.EnabledState)
-        )
-        signal.aperture_shutter.connect(
-            partial(
-                self._callback_update_label,
-                "aperture_shutter",
-                enum=MTDome.EnabledState,
-            )
-        )
-        signal.louvers.connect(
-            partial(
-                self._callback_update_label,
-                "louvers",
-                enum=MTDome.EnabledState,
-            )
-        )
-        signal.rear_access_door.connect(
-            partial(
-                self._callback_update_label,
-                "rear_access_door",
-                enum=MTDome.EnabledState,
-            )
-        )
-        signal.calibration_screen.connect(
-            partial(
-                self._callback_update_label,
-                "calibration_screen",
-                enum=MTDome.EnabledState,
-            )
-        )
 
-        signal.power_mode.connect(
-            partial(
-                self._callback_update_label,
-                "power_mode",
-                enum=MTDome.PowerManagementMode,
-            )
-        )
-
-        signal.control_mode.connect(
-            partial(
-                self._callback_update_label,
-                "control_mode",
-                enum=MTDome.ControlMode,
-            )
-        )
+        for field, names in (
+            ("azimuth_axis", NAMES_ENABLED_STATE),
+            ("elevation_axis", NAMES_ENABLED_STATE),
+            ("aperture_shutter", NAMES_ENABLED_STATE),
+            ("louvers", NAMES_ENABLED_STATE),
+            ("rear_access_door", NAMES_ENABLED_STATE),
+            ("calibration_screen", NAMES_ENABLED_STATE),
+            ("power_mode", _NAMES_POWER_MODE),
+            ("control_mode", _NAMES_CONTROL_MODE),
+        ):
+            getattr(signal, field).connect(partial(self._callback_update_label, field, names=names))
 
     @asyncSlot()
     async def _callback_update_brake_engaged(self, brake_engaged: int) -> None:
@@ -277,6 +266,10 @@ class ControlPanel(QWidget):
 
         self._button_brake_engaged.setText(hex(brake_engaged))
 
-        for idx, specific_brake in enumerate(MTDome.Brake):
-            is_engaged = bool(brake_engaged & (1 << specific_brake.value))
-            self._tab_brake.update_brake_status(idx, is_engaged)
+        # Only update the brakes that have been changed
+        bits_changed = brake_engaged ^ self._brake_engaged
+        self._brake_engaged = brake_engaged
+
+        for idx, mask in enumerate(_BRAKE_MASKS):
+            if bits_changed & mask:
+                self._tab_brake.update_brake_status(idx, bool(brake_engaged & mask))
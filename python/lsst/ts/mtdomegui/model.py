@@ -22,8 +22,10 @@
 __all__ = ["Model"]
 
 import asyncio
+import functools
 import logging
 import math
+import operator
 import pathlib
 import types
 import typing
@@ -43,6 +45,48 @@ from lsst.ts.xml.enums import MTDome
 
 from .reporter import Reporter
 
+# Subsystem ID of each low level component (LLC).
+_SUBSYSTEM_IDS = {llc_name: MTDome.SubSystemId(sid) for sid, llc_name in LlcNameDict.items()}
+
+# Get the code and description of a message in the status.
+_get_code_and_description = operator.itemgetter("code", "description")
+
+# Motion states indexed by their names. The names of `MTDome.MotionState`
+# take precedence over the translated ones.
+_MOTION_STATES = {**motion_state_translations, **MTDome.MotionState.__members__}
+
+# Motion states that are regarded as in-position for each subsystem.
+_IN_POSITION_AZIMUTH = frozenset(
+    (
+        MTDome.MotionState.STOPPED,
+        MTDome.MotionState.STOPPED_BRAKED,
+        MTDome.MotionState.CRAWLING,
+        MTDome.MotionState.PARKED,
+    )
+)
+_IN_POSITION_ELEVATION = frozenset(
+    (
+        MTDome.MotionState.STOPPED,
+        MTDome.MotionState.STOPPED_BRAKED,
+        MTDome.MotionState.CRAWLING,
+    )
+)
+_IN_POSITION_DOOR = frozenset(
+    (
+        MTDome.MotionState.STOPPED,
+        MTDome.MotionState.STOPPED_BRAKED,
+        MTDome.MotionState.CLOSED,
+        MTDome.MotionState.OPEN,
+    )
+)
+_IN_POSITION_LOUVER = _IN_POSITION_DOOR | {MTDome.MotionState.DISABLED}
+_IN_POSITION_CALIBRATION_SCREEN = frozenset(
+    (
+        MTDome.MotionState.STOPPED,
+        MTDome.MotionState.STOPPED_BRAKED,
+    )
+)
+
 
 class Model:
     """Model class of the application.
@@ -106,6 +150,34 @@ class Model:
         # Keep track of which brakes are engaged.
         self._brakes_engaged_bitmask = 0
 
+        # Functions to report the configuration of each low level component
+        # (LLC).
+        self._report_config_functions = {
+            LlcName.AMCS: self.reporter.report_config_azimuth,
+            LlcName.LWSCS: self.reporter.report_config_elevation,
+        }
+
+        # Functions to check the errors and report for each low level
+        # component (LLC).
+        self._check_errors_and_report_functions = {
+            LlcName.AMCS: self._check_errors_and_report_azimuth,
+            LlcName.LWSCS: self._check_errors_and_report_elevation,
+            LlcName.APSCS: self._check_errors_and_report_aperture_shutter,
+            LlcName.LCS: self._check_errors_and_report_louvers,
+            LlcName.RAD: self._check_errors_and_report_rear_access_door,
+            LlcName.CSCS: self._check_errors_and_report_calibration_screen,
+        }
+
+        # Functions to report the telemetry of the low level components
+        # (LLCs) that need the special handling. The telemetry of other LLCs
+        # is reported directly.
+        self._report_telemetry_functions = {
+            LlcName.MONCS: self._report_telemetry_moncs,
+            LlcName.OBC: self._report_telemetry_obc,
+            LlcName.CBCS: self._report_telemetry_cbcs,
+            LlcName.LLC: self._report_telemetry_llc,
+        }
+
         self.mtdome_com: MTDomeCom | None = None
 
     async def connect(self) -> None:
@@ -114,11 +186,7 @@ class Model:
         Start the mock controller, if simulating.
         """
 
-        config = type(
-            "Obj",
-            (object,),
-            {key: value for key, value in self.connection_information.items()},
-        )()
+        config = types.SimpleNamespace(**self.connection_information)
 
         simulation_mode = (
             ValidSimulationMode.SIMULATION_WITH_MOCK_CONTROLLER
@@ -126,29 +194,32 @@ class Model:
             else ValidSimulationMode.NORMAL_OPERATIONS
         )
 
-        telemetry_callbacks = (
-            {
-                LlcName.AMCS: self.callback_status_amcs,
-                LlcName.APSCS: self.callback_status_apscs,
-                LlcName.CBCS: self.callback_status_cbcs,
-                LlcName.CSCS: self.callback_status_cscs,
-                LlcName.LCS: self.callback_status_lcs,
-                LlcName.LWSCS: self.callback_status_lwscs,
-                LlcName.MONCS: self.callback_status_moncs,
-                LlcName.RAD: self.callback_status_rad,
-                LlcName.THCS: self.callback_status_thcs,
-                LlcName.LLC: self.callback_status_llc,
-            }
+        llc_names = (
+            [
+                LlcName.AMCS,
+                LlcName.APSCS,
+                LlcName.CBCS,
+                LlcName.CSCS,
+                LlcName.LCS,
+                LlcName.LWSCS,
+                LlcName.MONCS,
+                LlcName.RAD,
+                LlcName.THCS,
+                LlcName.LLC,
+            ]
             if self._is_simulation_mode
-            else {
-                LlcName.AMCS: self.callback_status_amcs,
-                LlcName.APSCS: self.callback_status_apscs,
-                LlcName.CBCS: self.callback_status_cbcs,
-                LlcName.THCS: self.callback_status_thcs,
-                LlcName.LCS: self.callback_status_lcs,
-                LlcName.LLC: self.callback_status_llc,
-            }
+            else [
+                LlcName.AMCS,
+                LlcName.APSCS,
+                LlcName.CBCS,
+                LlcName.THCS,
+                LlcName.LCS,
+                LlcName.LLC,
+            ]
         )
+        telemetry_callbacks = {
+            llc_name: functools.partial(self.report_llc_status, llc_name) for llc_name in llc_names
+        }
 
         self.mtdome_com = MTDomeCom(
             self.log,
@@ -243,7 +314,7 @@ class Model:
 
         # If there is only the "exception" key, it means that the status
         # reporting has failed. Return without reporting the status.
-        if "exception" in status.keys():
+        if "exception" in status:
             exception_message = str(status["exception"])
             self.log.error(f"Failed to report the status of {llc_name!r}: {exception_message}")
 
@@ -262,34 +333,91 @@ class Model:
 
         self._report_configuration(llc_name, status)
 
+        # Report the telemetry
+        report_telemetry = self._report_telemetry_functions.get(llc_name, self._report_telemetry_default)
+        report_telemetry(llc_name, status)
+
+    def _report_telemetry_default(self, llc_name: LlcName, status: dict[str, typing.Any]) -> None:
+        """Report the telemetry of the lower level component (LLC) directly.
+
+        Parameters
+        ----------
+        llc_name : enum `lsst.ts.mtdomecom.LlcName`
+            The name of LLC.
+        status : `dict`
+            System status.
+        """
+
+        # Workaround of the mypy check
+        assert self.mtdome_com is not None
+
         # Remove some keys because they are not reported in the telemetry
-        processed_telemetry = self.mtdome_com.remove_keys_from_dict(status, {"timestamp"})
+        self.reporter.report_telemetry(
+            llc_name.name.lower(),
+            self.mtdome_com.remove_keys_from_dict(status, {"timestamp"}),
+        )
 
-        # Report the telemetry
-        match llc_name:
-            case LlcName.MONCS:
-                # There is the question for the details of interlock at the
-                # moment. This part might be updated in the future.
-                interlocks = [bool(value) for value in processed_telemetry["data"]]
-                self.reporter.report_interlocks(interlocks)
-
-            case LlcName.OBC:
-                # The related event/telemetry is not defined yet.
-                # TODO: DM-40876 should give the details.
-                pass
-
-            case LlcName.CBCS:
-                processed_telemetry_update = self.mtdome_com.remove_keys_from_dict(
-                    processed_telemetry, {"status"}
-                )
-                self.reporter.report_capacitor_bank(processed_telemetry_update)
+    def _report_telemetry_moncs(self, llc_name: LlcName, status: dict[str, typing.Any]) -> None:
+        """Report the telemetry of the monitoring control system (MonCS).
+
+        Parameters
+        ----------
+        llc_name : enum `lsst.ts.mtdomecom.LlcName`
+            The name of LLC.
+        status : `dict`
+            System status.
+        """
+
+        # There is the question for the details of interlock at the moment.
+        # This part might be updated in the future.
+        self.reporter.report_interlocks(tuple(map(bool, status["data"])))
+
+    def _report_telemetry_obc(self, llc_name: LlcName, status: dict[str, typing.Any]) -> None:
+        """Report the telemetry of the overhead bridge crane (OBC).
+
+        Parameters
+        ----------
+        llc_name : enum `lsst.ts.mtdomecom.LlcName`
+            The name of LLC.
+        status : `dict`
+            System status.
+        """
+
+        # The related event/telemetry is not defined yet.
+        # TODO: DM-40876 should give the details.
+        pass
+
+    def _report_telemetry_cbcs(self, llc_name: LlcName, status: dict[str, typing.Any]) -> None:
+        """Report the telemetry of the capacitor banks control system (CBCS).
 
-            case LlcName.LLC:
-                control_mode = MTDome.ControlMode[status["control_mode"]]
-                self.reporter.report_state_control_mode(control_mode)
+        Parameters
+        ----------
+        llc_name : enum `lsst.ts.mtdomecom.LlcName`
+            The name of LLC.
+        status : `dict`
+            System status.
+        """
+
+        # Workaround of the mypy check
+        assert self.mtdome_com is not None
+
+        # Remove some keys because they are not reported in the telemetry
+        self.reporter.report_capacitor_bank(
+            self.mtdome_com.remove_keys_from_dict(status, {"timestamp", "status"})
+        )
+
+    def _report_telemetry_llc(self, llc_name: LlcName, status: dict[str, typing.Any]) -> None:
+        """Report the telemetry of the low level control.
+
+        Parameters
+        ----------
+        llc_name : enum `lsst.ts.mtdomecom.LlcName`
+            The name of LLC.
+        status : `dict`
+            System status.
+        """
 
-            case _:
-                self.reporter.report_telemetry(llc_name.name.lower(), processed_telemetry)
+        self.reporter.report_state_control_mode(MTDome.ControlMode[status["control_mode"]])
 
     async def _report_exception_fault_code(
         self, llc_name: LlcName, response_code: ResponseCode, exception_message: str, is_prompted: bool = True
@@ -362,10 +490,11 @@ class Model:
             Status.
         """
 
-        if "operationalMode" in status:
+        operational_mode = status.get("operationalMode")
+        if operational_mode is not None:
             self.reporter.report_operational_mode(
                 self._get_subsystem_id(llc_name),
-                MTDome.OperationalMode[status["operationalMode"]],
+                MTDome.OperationalMode[operational_mode],
             )
 
     def _get_subsystem_id(self, llc_name: LlcName) -> MTDome.SubSystemId:
@@ -382,7 +511,7 @@ class Model:
             Subsystem ID.
         """
 
-        return MTDome.SubSystemId([sid for sid, name in LlcNameDict.items() if name == llc_name][0])
+        return _SUBSYSTEM_IDS[llc_name]
 
     def _report_configuration(self, llc_name: LlcName, status: dict[str, typing.Any]) -> None:
         """Report the configuration.
@@ -395,18 +524,21 @@ class Model:
             Status.
         """
 
-        if "appliedConfiguration" in status:
-            configuration = status["appliedConfiguration"]
-
-            # Radial to degree conversion
-            for name in ["jmax", "amax", "vmax"]:
-                configuration[name] = math.degrees(configuration[name])
-
-            if llc_name == LlcName.AMCS:
-                self.reporter.report_config_azimuth(configuration)
-
-            elif llc_name == LlcName.LWSCS:
-                self.reporter.report_config_elevation(configuration)
+        configuration = status.get("appliedConfiguration")
+        if configuration is not None:
+            report_config = self._report_config_functions.get(llc_name)
+            if report_config is not None:
+                # Radial to degree conversion. Do not modify the status
+                # because it is reported as the telemetry later.
+                degrees = math.degrees
+                report_config(
+                    {
+                        **configuration,
+                        "jmax": degrees(configuration["jmax"]),
+                        "amax": degrees(configuration["amax"]),
+                        "vmax": degrees(configuration["vmax"]),
+                    }
+                )
 
     def _check_errors_and_report(self, llc_name: LlcName, status: dict[str, typing.Any]) -> None:
         """Check the errors and report.
@@ -419,29 +551,11 @@ class Model:
             Status.
         """
 
-        match llc_name:
-            case LlcName.AMCS:
-                self._check_errors_and_report_azimuth(status)
-
-            case LlcName.LWSCS:
-                self._check_errors_and_report_elevation(status)
-
-            case LlcName.APSCS:
-                self._check_errors_and_report_aperture_shutter(status)
-
-            case LlcName.LCS:
-                self._check_errors_and_report_louvers(status)
-
-            case LlcName.RAD:
-                self._check_errors_and_report_rear_access_door(status)
-
-            case LlcName.CSCS:
-                self._check_errors_and_report_calibration_screen(status)
-
-            case _:
-                # The details for other subsystems are not defined yet.
-                # See the ts_mtdome.
-                pass
+        # The details for other subsystems are not defined yet. See the
+        # ts_mtdome.
+        check_errors_and_report = self._check_errors_and_report_functions.get(llc_name)
+        if check_errors_and_report is not None:
+            check_errors_and_report(status)
 
     def _check_errors_and_report_azimuth(self, status: dict[str, typing.Any]) -> None:
         """Check the errors and report for the azimuth.
@@ -452,24 +566,21 @@ class Model:
             Status.
         """
 
+        reporter = self.reporter
+
         has_error, fault_code = self._get_fault_code(status)
         state = MTDome.EnabledState.FAULT if has_error else MTDome.EnabledState.ENABLED
 
-        self.reporter.report_state_azimuth_axis(state)
-        self.reporter.report_fault_code_azimuth_axis(fault_code)
+        reporter.report_state_azimuth_axis(state)
+        reporter.report_fault_code_azimuth_axis(fault_code)
 
         motion_state = self._translate_motion_state_if_necessary(status["status"])
         if motion_state is not None:
-            in_position = motion_state in [
-                MTDome.MotionState.STOPPED,
-                MTDome.MotionState.STOPPED_BRAKED,
-                MTDome.MotionState.CRAWLING,
-                MTDome.MotionState.PARKED,
-            ]
-            self.reporter.report_motion_azimuth_axis(motion_state, in_position)
+            in_position = motion_state in _IN_POSITION_AZIMUTH
+            reporter.report_motion_azimuth_axis(motion_state, in_position)
 
             self._set_brakes_engaged_bit(motion_state, MTDome.Brake.AMCS.value)
-            self.reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
+            reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
 
     def _get_fault_code(self, status: dict[str, typing.Any]) -> tuple[bool, str]:
         """Get the fault code.
@@ -489,17 +600,14 @@ class Model:
 
         messages = status["messages"]
 
-        codes = [message["code"] for message in messages]
-        has_error = (len(messages) != 1) or (codes[0] != 0)
+        # No error is the most common case
+        if (len(messages) == 1) and (messages[0]["code"] == 0):
+            return False, ""
 
-        fault_code = (
-            ", ".join([f"{message['code']}={message['description']}" for message in messages])
-            if has_error
-            else ""
+        return True, ", ".join(
+            [f"{code}={description}" for code, description in map(_get_code_and_description, messages)]
         )
 
-        return has_error, fault_code
-
     def _translate_motion_state_if_necessary(self, state: str) -> MTDome.MotionState | None:
         """Translate the motion state if necessary.
 
@@ -514,16 +622,11 @@ class Model:
             Motion state. If the state is unknown, it returns None.
         """
 
-        try:
-            return MTDome.MotionState[state]
-
-        except KeyError:
-            try:
-                return motion_state_translations[state]
+        motion_state = _MOTION_STATES.get(state)
+        if motion_state is None:
+            self.log.error(f"Unknown motion state: {state!r}")
 
-            except KeyError:
-                self.log.error(f"Unknown motion state: {state!r}")
-                return None
+        return motion_state
 
     def _set_brakes_engaged_bit(self, motion_state: MTDome.MotionState, index: int) -> None:
         """Set a bit on the brakes engaged bitmask.
@@ -550,23 +653,21 @@ class Model:
             Status.
         """
 
+        reporter = self.reporter
+
         has_error, fault_code = self._get_fault_code(status)
         state = MTDome.EnabledState.FAULT if has_error else MTDome.EnabledState.ENABLED
 
-        self.reporter.report_state_elevation_axis(state)
-        self.reporter.report_fault_code_elevation_axis(fault_code)
+        reporter.report_state_elevation_axis(state)
+        reporter.report_fault_code_elevation_axis(fault_code)
 
         motion_state = self._translate_motion_state_if_necessary(status["status"])
         if motion_state is not None:
-            in_position = motion_state in [
-                MTDome.MotionState.STOPPED,
-                MTDome.MotionState.STOPPED_BRAKED,
-                MTDome.MotionState.CRAWLING,
-            ]
-            self.reporter.report_motion_elevation_axis(motion_state, in_position)
+            in_position = motion_state in _IN_POSITION_ELEVATION
+            reporter.report_motion_elevation_axis(motion_state, in_position)
 
             self._set_brakes_engaged_bit(motion_state, MTDome.Brake.LWSCS.value)
-            self.reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
+            reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
 
     def _check_errors_and_report_aperture_shutter(self, status: dict[str, typing.Any]) -> None:
         """Check the errors and report for the aperture shutter.
@@ -577,38 +678,32 @@ class Model:
             Status.
         """
 
+        reporter = self.reporter
+
         has_error, fault_code = self._get_fault_code(status)
         state = MTDome.EnabledState.FAULT if has_error else MTDome.EnabledState.ENABLED
 
-        self.reporter.report_state_aperture_shutter(state)
-        self.reporter.report_fault_code_aperture_shutter(fault_code)
+        reporter.report_state_aperture_shutter(state)
+        reporter.report_fault_code_aperture_shutter(fault_code)
 
         # The number of statuses has been validated by the JSON schema. So
         # here it is safe to loop over all statuses.
-        motion_states = list()
-        in_positions = list()
-        for index, specific_status in enumerate(status["status"]):
-            motion_state = self._translate_motion_state_if_necessary(specific_status)
-
+        motion_states = [
+            self._translate_motion_state_if_necessary(specific_status) for specific_status in status["status"]
+        ]
+        for index, motion_state in enumerate(motion_states):
             if motion_state is None:
                 return
 
-            motion_states.append(motion_state)
-            in_positions.append(
-                motion_state
-                in [
-                    MTDome.MotionState.STOPPED,
-                    MTDome.MotionState.STOPPED_BRAKED,
-                    MTDome.MotionState.CLOSED,
-                    MTDome.MotionState.OPEN,
-                ]
-            )
-
             brake = MTDome.Brake.APSCS_LEFT_DOOR if (index == 0) else MTDome.Brake.APSCS_RIGHT_DOOR
             self._set_brakes_engaged_bit(motion_state, brake.value)
 
-        self.reporter.report_motion_aperture_shutter(motion_states, in_positions)
-        self.reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
+        # All the motion states are known here
+        known_motion_states = typing.cast(list[MTDome.MotionState], motion_states)
+        in_positions = [motion_state in _IN_POSITION_DOOR for motion_state in known_motion_states]
+
+        reporter.report_motion_aperture_shutter(known_motion_states, in_positions)
+        reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
 
     def _check_errors_and_report_louvers(self, status: dict[str, typing.Any]) -> None:
         """Check the errors and report for the louvers.
@@ -619,11 +714,13 @@ class Model:
             Status.
         """
 
+        reporter = self.reporter
+
         has_error, fault_code = self._get_fault_code(status)
         state = MTDome.EnabledState.FAULT if has_error else MTDome.EnabledState.ENABLED
 
-        self.reporter.report_state_louvers(state)
-        self.reporter.report_fault_code_louvers(fault_code)
+        reporter.report_state_louvers(state)
+        reporter.report_fault_code_louvers(fault_code)
 
         # The number of statuses has been validated by the JSON schema. So
         # here it is safe to loop over all statuses.
@@ -641,22 +738,13 @@ class Model:
                 return
 
             motion_states.append(motion_state)
-            in_positions.append(
-                motion_state
-                in [
-                    MTDome.MotionState.STOPPED,
-                    MTDome.MotionState.STOPPED_BRAKED,
-                    MTDome.MotionState.CLOSED,
-                    MTDome.MotionState.OPEN,
-                    MTDome.MotionState.DISABLED,
-                ]
-            )
+            in_positions.append(motion_state in _IN_POSITION_LOUVER)
 
             brake = MTDome.Brake[f"LOUVER_{louver.name}"]
             self._set_brakes_engaged_bit(motion_state, brake.value)
 
-        self.reporter.report_motion_louvers(motion_states, in_positions)
-        self.reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
+        reporter.report_motion_louvers(motion_states, in_positions)
+        reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
 
     def _check_errors_and_report_rear_access_door(self, status: dict[str, typing.Any]) -> None:
         """Check the errors and report for the rear access door.
@@ -667,38 +755,32 @@ class Model:
             Status.
         """
 
+        reporter = self.reporter
+
         has_error, fault_code = self._get_fault_code(status)
         state = MTDome.EnabledState.FAULT if has_error else MTDome.EnabledState.ENABLED
 
-        self.reporter.report_state_rear_access_door(state)
-        self.reporter.report_fault_code_rear_access_door(fault_code)
+        reporter.report_state_rear_access_door(state)
+        reporter.report_fault_code_rear_access_door(fault_code)
 
         # The number of statuses has been validated by the JSON schema. So
         # here it is safe to loop over all statuses.
-        motion_states = list()
-        in_positions = list()
-        for index, specific_status in enumerate(status["status"]):
-            motion_state = self._translate_motion_state_if_necessary(specific_status)
-
+        motion_states = [
+            self._translate_motion_state_if_necessary(specific_status) for specific_status in status["status"]
+        ]
+        for index, motion_state in enumerate(motion_states):
             if motion_state is None:
                 return
 
-            motion_states.append(motion_state)
-            in_positions.append(
-                motion_state
-                in [
-                    MTDome.MotionState.STOPPED,
-                    MTDome.MotionState.STOPPED_BRAKED,
-                    MTDome.MotionState.CLOSED,
-                    MTDome.MotionState.OPEN,
-                ]
-            )
-
             brake = MTDome.Brake.RAD_LEFT_DOOR if (index == 0) else MTDome.Brake.RAD_RIGHT_DOOR
             self._set_brakes_engaged_bit(motion_state, brake.value)
 
-        self.reporter.report_motion_rear_access_door(motion_states, in_positions)
-        self.reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
+        # All the motion states are known here
+        known_motion_states = typing.cast(list[MTDome.MotionState], motion_states)
+        in_positions = [motion_state in _IN_POSITION_DOOR for motion_state in known_motion_states]
+
+        reporter.report_motion_rear_access_door(known_motion_states, in_positions)
+        reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
 
     def _check_errors_and_report_calibration_screen(self, status: dict[str, typing.Any]) -> None:
         """Check the errors and report for the calibration screen.
@@ -709,139 +791,23 @@ class Model:
             Status.
         """
 
+        reporter = self.reporter
+
         has_error, fault_code = self._get_fault_code(status)
         state = MTDome.EnabledState.FAULT if has_error else MTDome.EnabledState.ENABLED
 
-        self.reporter.report_state_calibration_screen(state)
-        self.reporter.report_fault_code_calibration_screen(fault_code)
+        reporter.report_state_calibration_screen(state)
+        reporter.report_fault_code_calibration_screen(fault_code)
 
         # The number of statuses has been validated by the JSON schema. So
         # here it is safe to loop over all statuses.
         motion_state = self._translate_motion_state_if_necessary(status["status"])
         if motion_state is not None:
-            in_position = motion_state in [
-                MTDome.MotionState.STOPPED,
-                MTDome.MotionState.STOPPED_BRAKED,
-            ]
-            self.reporter.report_motion_calibration_screen(motion_state, in_position)
+            in_position = motion_state in _IN_POSITION_CALIBRATION_SCREEN
+            reporter.report_motion_calibration_screen(motion_state, in_position)
 
         self._set_brakes_engaged_bit(motion_state, MTDome.Brake.CSCS.value)
-        self.reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
-
-    async def callback_status_amcs(self, status: dict) -> None:
-        """Callback to report the status of azimuth motion control system
-        (AMCS).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.AMCS, status)
-
-    async def callback_status_apscs(self, status: dict) -> None:
-        """Callback to report the status of aperture shutter control system
-        (ApSCS).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.APSCS, status)
-
-    async def callback_status_cbcs(self, status: dict) -> None:
-        """Callback to report the status of capacitor banks control system
-        (CBCS).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.CBCS, status)
-
-    async def callback_status_cscs(self, status: dict) -> None:
-        """Callback to report the status of calibration screen control system
-        (CSCS).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.CSCS, status)
-
-    async def callback_status_lcs(self, status: dict) -> None:
-        """Callback to report the status of louvers control system (LCS).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.LCS, status)
-
-    async def callback_status_lwscs(self, status: dict) -> None:
-        """Callback to report the status of light and wind screen control
-        system (LWSCS).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.LWSCS, status)
-
-    async def callback_status_moncs(self, status: dict) -> None:
-        """Callback to report the status of monitoring control system (MonCS).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.MONCS, status)
-
-    async def callback_status_rad(self, status: dict) -> None:
-        """Callback to report the status of rear access door (RAD).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.RAD, status)
-
-    async def callback_status_thcs(self, status: dict) -> None:
-        """Callback to report the status of thermal control system (ThCS).
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.THCS, status)
-
-    async def callback_status_llc(self, status: dict) -> None:
-        """Callback to report the status of low level control.
-
-        Parameters
-        ----------
-        status : `dict`
-            System status.
-        """
-
-        await self.report_llc_status(LlcName.LLC, status)
+        reporter.report_state_brake_engaged(self._brakes_engaged_bitmask)
 
     async def __aenter__(self) -> object:
         """This is an overridden function to support the asynchronous context
@@ -22,9 +22,10 @@
 __all__ = ["Reporter"]
 
 import logging
+import typing
+from functools import cache
 
 from lsst.ts.mtdomecom import APSCS_NUM_SHUTTERS, LCS_NUM_LOUVERS, RAD_NUM_DOORS
-from lsst.ts.mtdomecom.schema import registry
 from lsst.ts.xml.enums import MTDome
 
 from .signals import (
@@ -40,6 +41,49 @@ from .signals import (
 from .status import Status
 from .utils import generate_dict_from_registry
 
+# Subsystems in the order of the `Status.operational_modes`.
+_SUBSYSTEMS = tuple(MTDome.SubSystemId)
+
+# Index of each subsystem in the `Status.operational_modes`.
+_SUBSYSTEM_INDEXES = {subsystem: idx for idx, subsystem in enumerate(_SUBSYSTEMS)}
+
+# Components with the default telemetry.
+_DEFAULT_TELEMETRY_COMPONENTS = ("AMCS", "LWSCS", "ApSCS", "LCS", "ThCS", "RAD", "CSCS")
+
+# Default motion states and in-positions of the multiple-element subsystems.
+# They are tuples so that they can be shared by every emission.
+_DEFAULT_MOTION_STATES_APSCS = (MTDome.MotionState.STOPPED,) * APSCS_NUM_SHUTTERS
+_DEFAULT_IN_POSITIONS_APSCS = (False,) * APSCS_NUM_SHUTTERS
+_DEFAULT_MOTION_STATES_LCS = (MTDome.MotionState.STOPPED,) * LCS_NUM_LOUVERS
+_DEFAULT_IN_POSITIONS_LCS = (False,) * LCS_NUM_LOUVERS
+_DEFAULT_MOTION_STATES_RAD = (MTDome.MotionState.STOPPED,) * RAD_NUM_DOORS
+_DEFAULT_IN_POSITIONS_RAD = (False,) * RAD_NUM_DOORS
+
+
+@cache
+def _get_default_telemetry(component: str) -> dict:
+    """Get the default telemetry of the component.
+
+    The registry schema is static, so the telemetry is only generated once.
+    The registry is imported on the first call to keep it out of the start
+    of the application.
+
+    Parameters
+    ----------
+    component : `str`
+        Component defined in the registry of ts_mtdomecom.
+
+    Returns
+    -------
+    `dict`
+        Default telemetry. This is shared by all callers and should not be
+        modified.
+    """
+
+    from lsst.ts.mtdomecom.schema import registry
+
+    return generate_dict_from_registry(registry, component)
+
 
 class Reporter:
     """Report class to report the system status.
@@ -59,25 +103,114 @@ class Reporter:
         Signals.
     """
 
+    __slots__ = (
+        "log",
+        "status",
+        "signals",
+        "_signal_interlock",
+        "_signal_state",
+        "_signal_operational_mode",
+        "_signal_telemetry",
+        "_signal_target",
+        "_signal_motion",
+        "_signal_fault_code",
+        "_signal_config",
+        "_signals_state",
+        "_signals_telemetry",
+        "_signals_fault_code",
+        "_signals_target",
+        "_signals_motion",
+    )
+
     def __init__(self, log: logging.Logger) -> None:
         self.log = log
 
         self.status = Status()
+
+        # Keep the typed references to emit the signals directly, and share
+        # the same instances in `self.signals` for the connections.
+        self._signal_interlock = SignalInterlock()
+        self._signal_state = SignalState()
+        self._signal_operational_mode = SignalOperationalMode()
+        self._signal_telemetry = SignalTelemetry()
+        self._signal_target = SignalTarget()
+        self._signal_motion = SignalMotion()
+        self._signal_fault_code = SignalFaultCode()
+        self._signal_config = SignalConfig()
+
         self.signals = {
-            "interlock": SignalInterlock(),
-            "state": SignalState(),
-            "operational_mode": SignalOperationalMode(),
-            "telemetry": SignalTelemetry(),
-            "target": SignalTarget(),
-            "motion": SignalMotion(),
-            "fault_code": SignalFaultCode(),
-            "config": SignalConfig(),
+            "interlock": self._signal_interlock,
+            "state": self._signal_state,
+            "operational_mode": self._signal_operational_mode,
+            "telemetry": self._signal_telemetry,
+            "target": self._signal_target,
+            "motion": self._signal_motion,
+            "fault_code": self._signal_fault_code,
+            "config": self._signal_config,
+        }
+
+        # Signal of each field in the `Status.state`.
+        signal_interlock = self._signal_interlock
+        signal_state = self._signal_state
+        self._signals_state = {
+            "lockingPinsEngaged": signal_interlock.locking_pins_engaged,
+            "brakeEngaged": signal_state.brake_engaged,
+            "azimuthAxis": signal_state.azimuth_axis,
+            "elevationAxis": signal_state.elevation_axis,
+            "apertureShutter": signal_state.aperture_shutter,
+            "louvers": signal_state.louvers,
+            "rearAccessDoor": signal_state.rear_access_door,
+            "calibrationScreen": signal_state.calibration_screen,
+            "powerMode": signal_state.power_mode,
+            "controlMode": signal_state.control_mode,
+        }
+
+        # Signal of each field in the `SignalTelemetry`.
+        signal_telemetry = self._signal_telemetry
+        self._signals_telemetry = {
+            "amcs": signal_telemetry.amcs,
+            "apscs": signal_telemetry.apscs,
+            "cbcs": signal_telemetry.cbcs,
+            "cscs": signal_telemetry.cscs,
+            "lcs": signal_telemetry.lcs,
+            "lwscs": signal_telemetry.lwscs,
+            "rad": signal_telemetry.rad,
+            "thcs": signal_telemetry.thcs,
+        }
+
+        # Signal of each field in the `SignalFaultCode`.
+        signal_fault_code = self._signal_fault_code
+        self._signals_fault_code = {
+            "azimuth_axis": signal_fault_code.azimuth_axis,
+            "elevation_axis": signal_fault_code.elevation_axis,
+            "aperture_shutter": signal_fault_code.aperture_shutter,
+            "louvers": signal_fault_code.louvers,
+            "rear_access_door": signal_fault_code.rear_access_door,
+            "calibration_screen": signal_fault_code.calibration_screen,
+        }
+
+        # Signal of each field in the `SignalTarget`.
+        signal_target = self._signal_target
+        self._signals_target = {
+            "position_velocity_azimuth": signal_target.position_velocity_azimuth,
+            "position_velocity_elevation": signal_target.position_velocity_elevation,
+        }
+
+        # Signal of each field in the `SignalMotion`.
+        signal_motion = self._signal_motion
+        self._signals_motion = {
+            "azimuth_axis": signal_motion.azimuth_axis,
+            "elevation_axis": signal_motion.elevation_axis,
+            "aperture_shutter": signal_motion.aperture_shutter,
+            "louvers": signal_motion.louvers,
+            "rear_access_door": signal_motion.rear_access_door,
+            "calibration_screen": signal_motion.calibration_screen,
         }
 
     def report_default(self) -> None:
         """Report the default status."""
 
-        self.signals["interlock"].interlock.emit(self.status.interlocks)  # type: ignore[attr-defined]
+        self._signal_interlock.interlock.emit(self.status.interlocks)
         self.report_state_locking_pins_engaged(0)
 
         self.report_state_brake_engaged(0)
@@ -91,46 +224,39 @@ class Reporter:
         self.report_state_power_mode(MTDome.PowerManagementMode.NO_POWER_MANAGEMENT)
         self.report_state_control_mode(MTDome.ControlMode.remote)
 
-        for subsystem in MTDome.SubSystemId:
+        for subsystem in _SUBSYSTEMS:
             self.report_operational_mode(subsystem, MTDome.OperationalMode.NORMAL)
 
         self.report_telemetry("cbcs", self.status.capacitor_bank)
-        self.signals["telemetry"].cbcs_voltage.emit(0.0)  # type: ignore[attr-defined]
+        self._signal_telemetry.cbcs_voltage.emit(0.0)
 
-        for component in ["AMCS", "LWSCS", "ApSCS", "LCS", "ThCS", "RAD", "CSCS"]:
-            self.report_telemetry(component.lower(), generate_dict_from_registry(registry, component))
+        for component in _DEFAULT_TELEMETRY_COMPONENTS:
+            self.report_telemetry(component.lower(), _get_default_telemetry(component))
 
         self.report_target_azimuth(0.0, 0.0)
         self.report_target_elevation(0.0, 0.0)
 
         self.report_motion_azimuth_axis(MTDome.MotionState.STOPPED, False)
         self.report_motion_elevation_axis(MTDome.MotionState.STOPPED, False)
-        self.report_motion_aperture_shutter(
-            [MTDome.MotionState.STOPPED] * APSCS_NUM_SHUTTERS,
-            [False] * APSCS_NUM_SHUTTERS,
-        )
-        self.report_motion_louvers(
-            [MTDome.MotionState.STOPPED] * LCS_NUM_LOUVERS,
-            [False] * LCS_NUM_LOUVERS,
-        )
-        self.report_motion_rear_access_door(
-            [MTDome.MotionState.STOPPED] * RAD_NUM_DOORS,
-            [False] * RAD_NUM_DOORS,
-        )
+        self.report_motion_aperture_shutter(_DEFAULT_MOTION_STATES_APSCS, _DEFAULT_IN_POSITIONS_APSCS)
+        self.report_motion_louvers(_DEFAULT_MOTION_STATES_LCS, _DEFAULT_IN_POSITIONS_LCS)
+        self.report_motion_rear_access_door(_DEFAULT_MOTION_STATES_RAD, _DEFAULT_IN_POSITIONS_RAD)
         self.report_motion_calibration_screen(MTDome.MotionState.STOPPED, False)
 
-    def report_interlocks(self, interlocks: list[bool]) -> None:
+    def report_interlocks(self, interlocks: typing.Sequence[bool]) -> None:
         """Report the interlocks.
 
         Parameters
         ----------
-        interlocks : `list` [`bool`]
+        interlocks : `list` or `tuple` [`bool`]
             Status of the interlocks. True is latched. Otherwise, False.
         """
 
-        if self.status.interlocks != interlocks:
-            self.status.interlocks = interlocks
-            self.signals["interlock"].interlock.emit(interlocks)  # type: ignore[attr-defined]
+        # tuple() does not copy if the interlocks are a tuple already
+        new_interlocks = tuple(interlocks)
+        if self.status.interlocks != new_interlocks:
+            self.status.interlocks = new_interlocks
+            self._signal_interlock.interlock.emit(new_interlocks)
 
     def report_state_locking_pins_engaged(self, engaged_pins: int) -> None:
         """Report the state of the engaged locking pins.
@@ -141,30 +267,23 @@ class Reporter:
             Bitmask of the locking pins that have been engaged.
         """
 
-        self._check_system_state_and_report(
-            "lockingPinsEngaged", "interlock", "locking_pins_engaged", engaged_pins
-        )
+        self._check_system_state_and_report("lockingPinsEngaged", engaged_pins)
 
-    def _check_system_state_and_report(
-        self, state_field: str, signal_name: str, signal_field: str, value: int
-    ) -> None:
+    def _check_system_state_and_report(self, state_field: str, value: int) -> None:
         """Check the system's state and report it if the value is changed.
 
         Parameters
         ----------
         state_field : `str`
             State's field.
-        signal_name : `str`
-            Signal's name defined in "self.signals".
-        signal_field : `str`
-            Signal's field.
         value : `int`
             New value.
         """
 
-        if self.status.state[state_field] != value:
-            self.status.state[state_field] = value
-            getattr(self.signals[signal_name], signal_field).emit(value)
+        state = self.status.state
+        if state[state_field] != value:
+            state[state_field] = value
+            self._signals_state[state_field].emit(value)
 
     def report_state_brake_engaged(self, brakes: int) -> None:
         """Report the state of the engaged brake.
@@ -175,7 +294,7 @@ class Reporter:
             Bitmask of the brakes that are engaged.
         """
 
-        self._check_system_state_and_report("brakeEngaged", "state", "brake_engaged", brakes)
+        self._check_system_state_and_report("brakeEngaged", brakes)
 
     def report_state_azimuth_axis(self, state: MTDome.EnabledState) -> None:
         """Report the state of the azimuth axis.
@@ -186,7 +305,7 @@ class Reporter:
             State of the azimuth axis.
         """
 
-        self._check_system_state_and_report("azimuthAxis", "state", "azimuth_axis", state.value)
+        self._check_system_state_and_report("azimuthAxis", state.value)
 
     def report_state_elevation_axis(self, state: MTDome.EnabledState) -> None:
         """Report the state of the elevation axis.
@@ -197,7 +316,7 @@ class Reporter:
             State of the elevation axis.
         """
 
-        self._check_system_state_and_report("elevationAxis", "state", "elevation_axis", state.value)
+        self._check_system_state_and_report("elevationAxis", state.value)
 
     def report_state_aperture_shutter(self, state: MTDome.EnabledState) -> None:
         """Report the state of the aperture shutter.
@@ -208,7 +327,7 @@ class Reporter:
             State of the aperture shutter.
         """
 
-        self._check_system_state_and_report("apertureShutter", "state", "aperture_shutter", state.value)
+        self._check_system_state_and_report("apertureShutter", state.value)
 
     def report_state_louvers(self, state: MTDome.EnabledState) -> None:
         """Report the state of the louvers.
@@ -219,7 +338,7 @@ class Reporter:
             State of the louvers.
         """
 
-        self._check_system_state_and_report("louvers", "state", "louvers", state.value)
+        self._check_system_state_and_report("louvers", state.value)
 
     def report_state_rear_access_door(self, state: MTDome.EnabledState) -> None:
         """Report the state of the rear access door.
@@ -230,7 +349,7 @@ class Reporter:
             State of the rear access door.
         """
 
-        self._check_system_state_and_report("rearAccessDoor", "state", "rear_access_door", state.value)
+        self._check_system_state_and_report("rearAccessDoor", state.value)
 
     def report_state_calibration_screen(self, state: MTDome.EnabledState) -> None:
         """Report the state of the calibration screen.
@@ -241,7 +360,7 @@ class Reporter:
             State of the calibration screen.
         """
 
-        self._check_system_state_and_report("calibrationScreen", "state", "calibration_screen", state.value)
+        self._check_system_state_and_report("calibrationScreen", state.value)
 
     def report_state_power_mode(self, mode: MTDome.PowerManagementMode) -> None:
         """Report the state of the power mode.
@@ -252,7 +371,7 @@ class Reporter:
             Power mode.
         """
 
-        self._check_system_state_and_report("powerMode", "state", "power_mode", mode.value)
+        self._check_system_state_and_report("powerMode", mode.value)
 
     def report_state_control_mode(self, mode: MTDome.ControlMode) -> None:
         """Report the state of the control mode.
@@ -263,7 +382,7 @@ class Reporter:
             Control mode.
         """
 
-        self._check_system_state_and_report("controlMode", "state", "control_mode", mode.value)
+        self._check_system_state_and_report("controlMode", mode.value)
 
     def report_operational_mode(self, subsystem: MTDome.SubSystemId, mode: MTDome.OperationalMode) -> None:
         """Report the operational mode of a subsystem.
@@ -276,15 +395,10 @@ class Reporter:
             Operational mode.
         """
 
-        for idx, specific_subsystem in enumerate(MTDome.SubSystemId):
-            if subsystem == specific_subsystem:
-                break
-
+        idx = _SUBSYSTEM_INDEXES[subsystem]
         if self.status.operational_modes[idx] != mode.value:
             self.status.operational_modes[idx] = mode.value
-            self.signals["operational_mode"].subsystem_mode.emit(  # type: ignore[attr-defined]
-                (subsystem, mode)
-            )
+            self._signal_operational_mode.subsystem_mode.emit((subsystem, mode))
 
     def report_capacitor_bank(self, capacitor_bank: dict[str, list[bool] | float]) -> None:
         """Report the status of the capacitor bank.
@@ -292,17 +406,21 @@ class Reporter:
         Parameters
         ----------
         capacitor_bank : `dict`
-            Status of the capacitor bank.
+            Status of the capacitor bank. It is not modified.
         """
 
-        self.signals["telemetry"].cbcs_voltage.emit(  # type: ignore[attr-defined]
-            capacitor_bank["dcBusVoltage"]
-        )
-        capacitor_bank.pop("dcBusVoltage")
+        self._signal_telemetry.cbcs_voltage.emit(capacitor_bank["dcBusVoltage"])
 
-        if self.status.capacitor_bank != capacitor_bank:
-            self.status.capacitor_bank = capacitor_bank  # type: ignore[assignment]
-            self.signals["telemetry"].cbcs.emit(capacitor_bank)  # type: ignore[attr-defined]
+        # Only compare the fields in the status, which exclude the
+        # "dcBusVoltage", so that nothing is copied if there is no change.
+        status_capacitor_bank = self.status.capacitor_bank
+        if any(capacitor_bank[key] != value for key, value in status_capacitor_bank.items()):
+            # The fields in the status are all lists of bool
+            new_capacitor_bank: dict[str, typing.Any] = {
+                key: capacitor_bank[key] for key in status_capacitor_bank
+            }
+            self.status.capacitor_bank = new_capacitor_bank
+            self._signal_telemetry.cbcs.emit(self.status.capacitor_bank)
 
     def report_config_azimuth(self, config: dict[str, float]) -> None:
         """Report the configuration of the azimuth motion control system
@@ -316,7 +434,7 @@ class Reporter:
 
         if self.status.config_amcs != config:
             self.status.config_amcs = config
-            self.signals["config"].amcs.emit(config)  # type: ignore[attr-defined]
+            self._signal_config.amcs.emit(config)
 
     def report_config_elevation(self, config: dict[str, float]) -> None:
         """Report the configuration of the elevation (light and wind screen)
@@ -330,7 +448,7 @@ class Reporter:
 
         if self.status.config_lwscs != config:
             self.status.config_lwscs = config
-            self.signals["config"].lwscs.emit(config)  # type: ignore[attr-defined]
+            self._signal_config.lwscs.emit(config)
 
     def report_telemetry(self, field: str, telemetry: dict) -> None:
         """Report the telemetry.
@@ -343,7 +461,7 @@ class Reporter:
             Telemetry defined in the schema/registry of ts_mtdomecom.
         """
 
-        getattr(self.signals["telemetry"], field).emit(telemetry)
+        self._signals_telemetry[field].emit(telemetry)
 
     def report_target_azimuth(self, position: float, velocity: float) -> None:
         """Report the azimuth target.
@@ -356,9 +474,7 @@ class Reporter:
             Target velocity in deg/sec.
         """
 
-        self.signals["target"].position_velocity_azimuth.emit(  # type: ignore[attr-defined]
-            (position, velocity)
-        )
+        self._check_target_and_report("position_velocity_azimuth", position, velocity)
 
     def report_target_elevation(self, position: float, velocity: float) -> None:
         """Report the elevation target.
@@ -371,9 +487,7 @@ class Reporter:
             Target velocity in deg/sec.
         """
 
-        self.signals["target"].position_velocity_elevation.emit(  # type: ignore[attr-defined]
-            (position, velocity)
-        )
+        self._check_target_and_report("position_velocity_elevation", position, velocity)
 
     def report_motion_azimuth_axis(self, motion_state: MTDome.MotionState, in_position: bool) -> None:
         """Report the motion of the azimuth axis.
@@ -386,7 +500,7 @@ class Reporter:
             True if the azimuth axis is in position. Otherwise, False.
         """
 
-        self.signals["motion"].azimuth_axis.emit((motion_state, in_position))  # type: ignore[attr-defined]
+        self._check_motion_and_report("azimuth_axis", motion_state, in_position)
 
     def report_motion_elevation_axis(self, motion_state: MTDome.MotionState, in_position: bool) -> None:
         """Report the motion of the elevation axis.
@@ -399,61 +513,61 @@ class Reporter:
             True if the elevation axis is in position. Otherwise, False.
         """
 
-        self.signals["motion"].elevation_axis.emit((motion_state, in_position))  # type: ignore[attr-defined]
+        self._check_motion_and_report("elevation_axis", motion_state, in_position)
 
     def report_motion_aperture_shutter(
-        self, motion_states: list[MTDome.MotionState], in_positions: list[bool]
+        self,
+        motion_states: typing.Sequence[MTDome.MotionState],
+        in_positions: typing.Sequence[bool],
     ) -> None:
         """Report the motion of the aperture shutter.
 
         Parameters
         ----------
-        motion_states : `list` [enum `MTDome.MotionState`]
+        motion_states : `list` or `tuple` [enum `MTDome.MotionState`]
             List of the Motion states.
-        in_positions : `list` [`bool`]
+        in_positions : `list` or `tuple` [`bool`]
             List of the in-position. True if the aperture shutter is in
             position. Otherwise, False.
         """
 
-        self.signals["motion"].aperture_shutter.emit(  # type: ignore[attr-defined]
-            (motion_states, in_positions)
-        )
+        self._check_motion_and_report("aperture_shutter", tuple(motion_states), tuple(in_positions))
 
     def report_motion_louvers(
-        self, motion_states: list[MTDome.MotionState], in_positions: list[bool]
+        self,
+        motion_states: typing.Sequence[MTDome.MotionState],
+        in_positions: typing.Sequence[bool],
     ) -> None:
         """Report the motion of the louvers.
 
         Parameters
         ----------
-        motion_states : `list` [enum `MTDome.MotionState`]
+        motion_states : `list` or `tuple` [enum `MTDome.MotionState`]
             List of the Motion states.
-        in_positions : `list` [`bool`]
+        in_positions : `list` or `tuple` [`bool`]
             List of the in-position. True if the louver is in
             position. Otherwise, False.
         """
 
-        self.signals["motion"].louvers.emit(  # type: ignore[attr-defined]
-            (motion_states, in_positions)
-        )
+        self._check_motion_and_report("louvers", tuple(motion_states), tuple(in_positions))
 
     def report_motion_rear_access_door(
-        self, motion_states: list[MTDome.MotionState], in_positions: list[bool]
+        self,
+        motion_states: typing.Sequence[MTDome.MotionState],
+        in_positions: typing.Sequence[bool],
     ) -> None:
         """Report the motion of the rear access door.
 
         Parameters
         ----------
-        motion_states : `list` [enum `MTDome.MotionState`]
+        motion_states : `list` or `tuple` [enum `MTDome.MotionState`]
             List of the Motion states.
-        in_positions : `list` [`bool`]
+        in_positions : `list` or `tuple` [`bool`]
             List of the in-position. True if the rear access door is in
             position. Otherwise, False.
         """
 
-        self.signals["motion"].rear_access_door.emit(  # type: ignore[attr-defined]
-            (motion_states, in_positions)
-        )
+        self._check_motion_and_report("rear_access_door", tuple(motion_states), tuple(in_positions))
 
     def report_motion_calibration_screen(self, motion_state: MTDome.MotionState, in_position: bool) -> None:
         """Report the motion of the calibration screen.
@@ -466,7 +580,7 @@ class Reporter:
             True if the calibration screen is in position. Otherwise, False.
         """
 
-        self.signals["motion"].calibration_screen.emit((motion_state, in_position))  # type: ignore[attr-defined]
+        self._check_motion_and_report("calibration_screen", motion_state, in_position)
 
     def report_fault_code_azimuth_axis(self, fault_code: str) -> None:
         """Report the fault code of the azimuth axis.
@@ -477,7 +591,7 @@ class Reporter:
             Fault code.
         """
 
-        self.signals["fault_code"].azimuth_axis.emit(fault_code)  # type: ignore[attr-defined]
+        self._check_fault_code_and_report("azimuth_axis", fault_code)
 
     def report_fault_code_elevation_axis(self, fault_code: str) -> None:
         """Report the fault code of the elevation axis.
@@ -488,7 +602,7 @@ class Reporter:
             Fault code.
         """
 
-        self.signals["fault_code"].elevation_axis.emit(fault_code)  # type: ignore[attr-defined]
+        self._check_fault_code_and_report("elevation_axis", fault_code)
 
     def report_fault_code_aperture_shutter(self, fault_code: str) -> None:
         """Report the fault code of the aperture shutter.
@@ -499,7 +613,7 @@ class Reporter:
             Fault code.
         """
 
-        self.signals["fault_code"].aperture_shutter.emit(fault_code)  # type: ignore[attr-defined]
+        self._check_fault_code_and_report("aperture_shutter", fault_code)
 
     def report_fault_code_louvers(self, fault_code: str) -> None:
         """Report the fault code of the louvers.
@@ -510,7 +624,7 @@ class Reporter:
             Fault code.
         """
 
-        self.signals["fault_code"].louvers.emit(fault_code)  # type: ignore[attr-defined]
+        self._check_fault_code_and_report("louvers", fault_code)
 
     def report_fault_code_rear_access_door(self, fault_code: str) -> None:
         """Report the fault code of the rear access door.
@@ -521,7 +635,7 @@ class Reporter:
             Fault code.
         """
 
-        self.signals["fault_code"].rear_access_door.emit(fault_code)  # type: ignore[attr-defined]
+        self._check_fault_code_and_report("rear_access_door", fault_code)
 
     def report_fault_code_calibration_screen(self, fault_code: str) -> None:
         """Report the fault code of the calibration screen.
@@ -532,4 +646,73 @@ class Reporter:
             Fault code.
         """
 
-        self.signals["fault_code"].calibration_screen.emit(fault_code)  # type: ignore[attr-defined]
+        self._check_fault_code_and_report("calibration_screen", fault_code)
+
+    def _check_fault_code_and_report(self, signal_field: str, fault_code: str) -> None:
+        """Check the fault code and report it if the value is changed.
+
+        Parameters
+        ----------
+        signal_field : `str`
+            Field defined in the `SignalFaultCode`.
+        fault_code : `str`
+            Fault code.
+        """
+
+        fault_codes = self.status.fault_codes
+        if fault_codes.get(signal_field) != fault_code:
+            fault_codes[signal_field] = fault_code
+            self._signals_fault_code[signal_field].emit(fault_code)
+
+    def _check_target_and_report(self, signal_field: str, position: float, velocity: float) -> None:
+        """Check the target and report it if the value is changed.
+
+        The (position, velocity) tuple is only created when the target is
+        changed.
+
+        Parameters
+        ----------
+        signal_field : `str`
+            Field defined in the `SignalTarget`.
+        position : `float`
+            Target position.
+        velocity : `float`
+            Target velocity.
+        """
+
+        targets = self.status.targets
+        target = targets.get(signal_field)
+        if (target is None) or (target[0] != position) or (target[1] != velocity):
+            target = (position, velocity)
+            targets[signal_field] = target
+            self._signals_target[signal_field].emit(target)
+
+    def _check_motion_and_report(
+        self,
+        signal_field: str,
+        motion_state: MTDome.MotionState | tuple[MTDome.MotionState, ...],
+        in_position: bool | tuple[bool, ...],
+    ) -> None:
+        """Check the motion and report it if the value is changed.
+
+        The (motion_state, in_position) tuple is only created when the motion
+        is changed.
+
+        Parameters
+        ----------
+        signal_field : `str`
+            Field defined in the `SignalMotion`.
+        motion_state : enum `MTDome.MotionState` or `tuple`
+            Motion state. For the multiple-element subsystems, this is the
+            tuple of motion states.
+        in_position : `bool` or `tuple`
+            In-position. For the multiple-element subsystems, this is the
+            tuple of in-positions.
+        """
+
+        motions = self.status.motions
+        motion = motions.get(signal_field)
+        if (motion is None) or (motion[0] != motion_state) or (motion[1] != in_position):
+            motion = (motion_state, in_position)
+            motions[signal_field] = motion
+            self._signals_motion[signal_field].emit(motion)
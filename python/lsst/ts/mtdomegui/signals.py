@@ -149,7 +149,8 @@ class SignalMotion(QtCore.QObject):
     `lsst.ts.xml.enums.MTDome.MotionState`. "in_position" is a boolean value.
 
     Note for the "aperture_shutter" and "louvers", it would be
-    (motion_states, in_positions), which means both of the elements are list.
+    (motion_states, in_positions), which means both of the elements are
+    sequences (list or tuple).
     """
 
     azimuth_axis = QtCore.Signal(object)
@@ -27,12 +27,12 @@ from lsst.ts.mtdomecom import CBCS_NUM_CAPACITOR_BANKS, MON_NUM_SENSORS
 from lsst.ts.xml.enums import MTDome
 
 
-@dataclass
+@dataclass(slots=True)
 class Status:
     """System status."""
 
-    # Interlocks.
-    interlocks: list[bool] = field(default_factory=lambda: [False] * MON_NUM_SENSORS)
+    # Interlocks. Use the tuple to keep the reported snapshot unchanged.
+    interlocks: tuple[bool, ...] = (False,) * MON_NUM_SENSORS
 
     # System state. See the `SignalState` for the enum of each field.
     # Put the default values of "lockingPinsEngaged" and "brakeEngaged" to -1
@@ -86,3 +86,16 @@ class Status:
             "vmax": 0.0,
         }
     )
+
+    # Fault code of each subsystem. The key is the field defined in the
+    # `SignalFaultCode`. There is no value until the fault code is reported.
+    fault_codes: dict[str, str] = field(default_factory=dict)
+
+    # Target (position, velocity) of each axis. The key is the field defined
+    # in the `SignalTarget`. There is no value until the target is reported.
+    targets: dict[str, tuple[float, float]] = field(default_factory=dict)
+
+    # Motion (motion_state(s), in_position(s)) of each subsystem. The key is
+    # the field defined in the `SignalMotion`. There is no value until the
+    # motion is reported.
+    motions: dict[str, tuple] = field(default_factory=dict)
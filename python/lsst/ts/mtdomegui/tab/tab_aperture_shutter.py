@@ -21,6 +21,8 @@
 
 __all__ = ["TabApertureShutter"]
 
+from itertools import chain
+
 from PySide6.QtWidgets import (
     QFormLayout,
     QGroupBox,
@@ -35,7 +37,7 @@ from lsst.ts.guitool import TabTemplate, create_group_box, create_label
 from lsst.ts.mtdomecom import APSCS_NUM_SHUTTERS
 from lsst.ts.xml.enums import MTDome
 
-from ..constants import NUM_DRIVE_SHUTTER
+from ..constants import NAMES_ENABLED_STATE, NUM_DRIVE_SHUTTER
 from ..model import Model
 from ..signals import SignalFaultCode, SignalMotion, SignalState, SignalTelemetry
 from ..utils import (
@@ -45,6 +47,13 @@ from ..utils import (
 )
 from .tab_figure import TabFigure
 
+# Formatters of the telemetry labels.
+_FORMAT_PERCENT = "{:.2f} %".format
+_FORMAT_TORQUE = "{:.2f} N*m".format
+_FORMAT_CURRENT = "{:.2f} A".format
+_FORMAT_TEMPERATURE = "{:.2f} deg C".format
+_FORMAT_POWER = "{:.2f} W".format
+
 
 class TabApertureShutter(TabTemplate):
     """Table of the aperture shutter.
@@ -347,31 +356,33 @@ class TabApertureShutter(TabTemplate):
         """
 
         # Label
+        status = self._status
+
         position_commanded = telemetry["positionCommanded"]
         position_actual = telemetry["positionActual"]
-        for idx in range(APSCS_NUM_SHUTTERS):
-            self._status["position_commanded"][idx].setText(f"{position_commanded[idx]:.2f} %")
-            self._status["position_actual"][idx].setText(f"{position_actual[idx]:.2f} %")
-
-        for idx in range(NUM_DRIVE_SHUTTER):
-            self._status["drive_torque_commanded"][idx].setText(
-                f"{telemetry['driveTorqueCommanded'][idx]:.2f} N*m"
-            )
-            self._status["drive_torque_actual"][idx].setText(f"{telemetry['driveTorqueActual'][idx]:.2f} N*m")
-            self._status["drive_current_actual"][idx].setText(f"{telemetry['driveCurrentActual'][idx]:.2f} A")
-
-        for idx in range(NUM_DRIVE_SHUTTER):
-            self._status["drive_temperature"][idx].setText(f"{telemetry['driveTemperature'][idx]:.2f} deg C")
+        drive_torque_actual = telemetry["driveTorqueActual"]
+        drive_current_actual = telemetry["driveCurrentActual"]
+        drive_temperature = telemetry["driveTemperature"]
+        for field, values, format_value in (
+            ("position_commanded", position_commanded, _FORMAT_PERCENT),
+            ("position_actual", position_actual, _FORMAT_PERCENT),
+            ("drive_torque_commanded", telemetry["driveTorqueCommanded"], _FORMAT_TORQUE),
+            ("drive_torque_actual", drive_torque_actual, _FORMAT_TORQUE),
+            ("drive_current_actual", drive_current_actual, _FORMAT_CURRENT),
+            ("drive_temperature", drive_temperature, _FORMAT_TEMPERATURE),
+        ):
+            for label, value in zip(status[field], values):  # type: ignore[arg-type]
+                label.setText(format_value(value))
 
         power = telemetry["powerDraw"]
-        self._status["power_draw"].setText(f"{power:.2f} W")  # type: ignore[union-attr]
+        status["power_draw"].setText(_FORMAT_POWER(power))  # type: ignore[union-attr]
 
         # Real-time chart
-        self._figures["position"].append_data(position_commanded + position_actual)
+        self._figures["position"].append_data(chain(position_commanded, position_actual))
 
-        self._figures["drive_torque"].append_data(telemetry["driveTorqueActual"])
-        self._figures["drive_current"].append_data(telemetry["driveCurrentActual"])
-        self._figures["drive_temperature"].append_data(telemetry["driveTemperature"])
+        self._figures["drive_torque"].append_data(drive_torque_actual)
+        self._figures["drive_current"].append_data(drive_current_actual)
+        self._figures["drive_temperature"].append_data(drive_temperature)
 
         self._figures["resolver"].append_data(telemetry["resolverHeadCalibrated"])
 
@@ -398,7 +409,7 @@ class TabApertureShutter(TabTemplate):
             State.
         """
 
-        self._states["state"].setText(MTDome.EnabledState(state).name)
+        self._states["state"].setText(NAMES_ENABLED_STATE[state])
 
     def _set_signal_motion(self, signal: SignalMotion) -> None:
         """Set the motion signal.
@@ -422,7 +433,7 @@ class TabApertureShutter(TabTemplate):
         """
 
         self._states["motion"].setText(", ".join([value.name for value in motion[0]]))
-        self._states["in_position"].setText(", ".join([str(value) for value in motion[1]]))
+        self._states["in_position"].setText(", ".join(map(str, motion[1])))
 
     def _set_signal_fault_code(self, signal: SignalFaultCode) -> None:
         """Set the fault code signal.
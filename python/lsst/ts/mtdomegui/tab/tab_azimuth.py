@@ -21,7 +21,8 @@
 
 __all__ = ["TabAzimuth"]
 
-import numpy as np
+import math
+
 from PySide6.QtWidgets import (
     QFormLayout,
     QGroupBox,
@@ -36,6 +37,7 @@ from lsst.ts.guitool import TabTemplate, create_group_box, create_label
 from lsst.ts.mtdomecom import AMCS_NUM_MOTORS, AMCS_NUM_RESOLVERS
 from lsst.ts.xml.enums import MTDome
 
+from ..constants import NAMES_ENABLED_STATE
 from ..model import Model
 from ..signals import (
     SignalFaultCode,
@@ -52,6 +54,13 @@ from ..utils import (
 from .tab_figure import TabFigure
 
 
+# Formatters of the telemetry labels.
+_FORMAT_POSITION = "{:.2f} deg".format
+_FORMAT_VELOCITY = "{:.2f} deg/sec".format
+_FORMAT_TORQUE = "{:.2f} N*m".format
+_FORMAT_CURRENT = "{:.2f} A".format
+
+
 class TabAzimuth(TabTemplate):
     """Table of the azimuth.
 
@@ -80,6 +89,14 @@ class TabAzimuth(TabTemplate):
         self._figures = self._create_figures()
         self._buttons = self._create_buttons()
 
+        # Latest telemetry that has not been shown on the labels yet. The
+        # labels are updated by the timer to coalesce the telemetry that
+        # arrives faster than the refresh frequency.
+        self._telemetry: dict | None = None
+
+        # Timer to update the labels
+        self._timer = self.create_and_start_timer(self._callback_time_out, self.model.duration_refresh)
+
         self.set_widget_and_layout()
 
         signals = self.model.reporter.signals
@@ -138,6 +155,7 @@ class TabAzimuth(TabTemplate):
             Figures.
         """
 
+        legends_motor = [str(idx) for idx in range(AMCS_NUM_MOTORS)]
         return {
             "position": TabFigure("Position", self.model, "deg", ["commanded", "actual"]),
             "velocity": TabFigure("Velocity", self.model, "deg/sec", ["commanded", "actual"]),
@@ -145,19 +163,19 @@ class TabAzimuth(TabTemplate):
                 "Actual Drive Torque",
                 self.model,
                 "N*m",
-                [str(idx) for idx in range(AMCS_NUM_MOTORS)],
+                legends_motor,
             ),
             "drive_current": TabFigure(
                 "Actual Drive Current",
                 self.model,
                 "A",
-                [str(idx) for idx in range(AMCS_NUM_MOTORS)],
+                legends_motor,
             ),
             "encoder_head": TabFigure(
                 "Calibrated Encoder Head",
                 self.model,
                 "deg",
-                [str(idx) for idx in range(AMCS_NUM_MOTORS)],
+                legends_motor,
             ),
             "position_encoder": TabFigure(
                 "Calibrated Position Encoder",
@@ -323,32 +341,18 @@ class TabAzimuth(TabTemplate):
             Telemetry.
         """
 
-        # Label
+        # The labels are updated in self._callback_time_out()
+        self._telemetry = telemetry
+
         position_commanded = telemetry["positionCommanded"]
         position_actual = telemetry["positionActual"]
-        self._status["position_commanded"].setText(  # type: ignore[union-attr]
-            f"{position_commanded:.2f} deg"
-        )
-        self._status["position_actual"].setText(f"{position_actual:.2f} deg")  # type: ignore[union-attr]
-
         velocity_commanded = telemetry["velocityCommanded"]
         velocity_actual = telemetry["velocityActual"]
-        self._status["velocity_commanded"].setText(  # type: ignore[union-attr]
-            f"{velocity_commanded:.2f} deg/sec"
-        )
-        self._status["velocity_actual"].setText(f"{velocity_actual:.2f} deg/sec")  # type: ignore[union-attr]
-
-        for idx in range(AMCS_NUM_MOTORS):
-            self._status["drive_torque_commanded"][idx].setText(
-                f"{telemetry['driveTorqueCommanded'][idx]:.2f} N*m"
-            )
-            self._status["drive_torque_actual"][idx].setText(f"{telemetry['driveTorqueActual'][idx]:.2f} N*m")
-            self._status["drive_current_actual"][idx].setText(f"{telemetry['driveCurrentActual'][idx]:.2f} A")
 
         # Real-time chart
 
         # In the crawing, the commanded position is NaN
-        if np.isnan(position_commanded):
+        if math.isnan(position_commanded):
             position_commanded = position_actual
 
         self._figures["position"].append_data([position_commanded, position_actual])
@@ -360,6 +364,42 @@ class TabAzimuth(TabTemplate):
         self._figures["encoder_head"].append_data(telemetry["encoderHeadCalibrated"])
         self._figures["position_encoder"].append_data(telemetry["barcodeHeadCalibrated"])
 
+    @asyncSlot()
+    async def _callback_time_out(self) -> None:
+        """Callback timeout function to update the labels."""
+
+        if self._telemetry is not None:
+            self._update_labels(self._telemetry)
+            self._telemetry = None
+
+        self.check_duration_and_restart_timer(self._timer, self.model.duration_refresh)
+
+    def _update_labels(self, telemetry: dict) -> None:
+        """Update the labels.
+
+        Parameters
+        ----------
+        telemetry : `dict`
+            Telemetry.
+        """
+
+        status = self._status
+        for field, name, format_value in (
+            ("position_commanded", "positionCommanded", _FORMAT_POSITION),
+            ("position_actual", "positionActual", _FORMAT_POSITION),
+            ("velocity_commanded", "velocityCommanded", _FORMAT_VELOCITY),
+            ("velocity_actual", "velocityActual", _FORMAT_VELOCITY),
+        ):
+            status[field].setText(format_value(telemetry[name]))  # type: ignore[union-attr]
+
+        for field, values, format_value in (
+            ("drive_torque_commanded", telemetry["driveTorqueCommanded"], _FORMAT_TORQUE),
+            ("drive_torque_actual", telemetry["driveTorqueActual"], _FORMAT_TORQUE),
+            ("drive_current_actual", telemetry["driveCurrentActual"], _FORMAT_CURRENT),
+        ):
+            for label, value in zip(status[field], values):  # type: ignore[arg-type]
+                label.setText(format_value(value))
+
     def _set_signal_target(self, signal: SignalTarget) -> None:
         """Set the target signal.
 
@@ -406,7 +446,7 @@ class TabAzimuth(TabTemplate):
             State.
         """
 
-        self._states["state"].setText(MTDome.EnabledState(state).name)
+        self._states["state"].setText(NAMES_ENABLED_STATE[state])
 
     def _set_signal_motion(self, signal: SignalMotion) -> None:
         """Set the motion signal.
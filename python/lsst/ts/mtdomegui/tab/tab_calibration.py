@@ -34,6 +34,7 @@ from qasync import asyncSlot
 from lsst.ts.guitool import TabTemplate, create_group_box, create_label
 from lsst.ts.xml.enums import MTDome
 
+from ..constants import NAMES_ENABLED_STATE
 from ..model import Model
 from ..signals import SignalFaultCode, SignalMotion, SignalState, SignalTelemetry
 from ..utils import add_empty_row_to_form_layout, create_buttons_with_tabs, create_window_fault_code
@@ -363,7 +364,7 @@ class TabCalibration(TabTemplate):
             State.
         """
 
-        self._states["state"].setText(MTDome.EnabledState(state).name)
+        self._states["state"].setText(NAMES_ENABLED_STATE[state])
 
     def _set_signal_motion(self, signal: SignalMotion) -> None:
         """Set the motion signal.
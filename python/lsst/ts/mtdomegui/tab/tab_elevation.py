@@ -35,6 +35,7 @@ from lsst.ts.guitool import TabTemplate, create_group_box, create_label
 from lsst.ts.mtdomecom import LWSCS_NUM_MOTORS
 from lsst.ts.xml.enums import MTDome
 
+from ..constants import NAMES_ENABLED_STATE
 from ..model import Model
 from ..signals import (
     SignalFaultCode,
@@ -458,7 +459,7 @@ class TabElevation(TabTemplate):
             State.
         """
 
-        self._states["state"].setText(MTDome.EnabledState(state).name)
+        self._states["state"].setText(NAMES_ENABLED_STATE[state])
 
     def _set_signal_motion(self, signal: SignalMotion) -> None:
         """Set the motion signal.
@@ -21,6 +21,9 @@
 
 __all__ = ["TabFigure"]
 
+import typing
+from collections import deque
+
 from PySide6.QtGui import QShowEvent
 from PySide6.QtWidgets import QVBoxLayout
 
@@ -65,7 +68,7 @@ class TabFigure(TabTemplate):
 
         self.model = model
 
-        self._data = [[0.0] * num_realtime for _ in range(len(legends))]
+        self._data = [deque([0.0] * num_realtime, maxlen=num_realtime) for _ in range(len(legends))]
         self._figure = self._create_figure(title_y, legends, num_realtime)
 
         self.set_widget_and_layout()
@@ -125,20 +128,19 @@ class TabFigure(TabTemplate):
             for point in points:
                 self._figure.append_data(point, idx=idx)
 
-    def append_data(self, new_data: list[float]) -> None:
+    def append_data(self, new_data: typing.Iterable[float]) -> None:
         """Append the data to the internal cache while keeping the same length.
         The figure will only be updated when it is visible to save the CPU
         usage.
 
         Parameters
         ----------
-        new_data : `list` [`float`]
-            New data.
+        new_data : iterable [`float`]
+            New data. Each value is for the line of the same index.
         """
 
         for idx, value in enumerate(new_data):
-            # Cache the new data
-            self._data[idx].pop(0)
+            # Cache the new data, the oldest one is dropped by the deque
             self._data[idx].append(value)
 
             # Only update the figure when it is visible
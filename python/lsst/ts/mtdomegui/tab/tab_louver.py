@@ -40,6 +40,7 @@ from lsst.ts.guitool import (
 from lsst.ts.mtdomecom import LCS_NUM_MOTORS_PER_LOUVER
 from lsst.ts.xml.enums import MTDome
 
+from ..constants import NAMES_ENABLED_STATE
 from ..model import Model
 from ..signals import SignalFaultCode, SignalMotion, SignalState, SignalTelemetry
 from ..utils import create_window_fault_code
@@ -298,7 +299,7 @@ class TabLouver(TabTemplate):
             State.
         """
 
-        self._state.setText(MTDome.EnabledState(state).name)
+        self._state.setText(NAMES_ENABLED_STATE[state])
 
     def _set_signal_motion(self, signal: SignalMotion) -> None:
         """Set the motion signal.
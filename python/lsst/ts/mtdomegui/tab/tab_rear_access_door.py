@@ -45,6 +45,7 @@ from lsst.ts.mtdomecom import (
 )
 from lsst.ts.xml.enums import MTDome
 
+from ..constants import NAMES_ENABLED_STATE
 from ..model import Model
 from ..signals import SignalFaultCode, SignalMotion, SignalState, SignalTelemetry
 from ..utils import (
@@ -503,7 +504,7 @@ class TabRearAccessDoor(TabTemplate):
             State.
         """
 
-        self._states["state"].setText(MTDome.EnabledState(state).name)
+        self._states["state"].setText(NAMES_ENABLED_STATE[state])
 
     def _set_signal_motion(self, signal: SignalMotion) -> None:
         """Set the motion signal.
@@ -527,7 +528,7 @@ class TabRearAccessDoor(TabTemplate):
         """
 
         self._states["motion"].setText(", ".join([value.name for value in motion[0]]))
-        self._states["in_position"].setText(", ".join([str(value) for value in motion[1]]))
+        self._states["in_position"].setText(", ".join(map(str, motion[1])))
 
     def _set_signal_fault_code(self, signal: SignalFaultCode) -> None:
         """Set the fault code signal.
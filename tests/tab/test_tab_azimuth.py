@@ -80,6 +80,53 @@ async def test_set_signal_telemetry(widget: TabAzimuth) -> None:
         assert figure._data[0][-1] == 1.0
 
 
+@pytest.mark.asyncio
+async def test_set_signal_telemetry_coalesce(widget: TabAzimuth) -> None:
+    # Stop the refresh timer, so the labels can only be updated by the
+    # telemetry signal itself
+    widget._timer.stop()
+    position_actual = widget._status["position_actual"].text()
+
+    # Two telemetry frames arrive within one refresh period
+    for value in (1.0, 2.0):
+        widget.model.reporter.report_telemetry(
+            "amcs", generate_dict_from_registry(registry, "AMCS", default_number=value)
+        )
+
+    # Sleep so the event loop can access CPU to handle the signal
+    await asyncio.sleep(1)
+
+    # The labels are not updated before the timer fires
+    assert widget._status["position_actual"].text() == position_actual
+    assert widget._telemetry is not None
+    assert widget._telemetry["positionActual"] == 2.0
+
+    # Each frame still reaches the realtime charts
+    for figure in widget._figures.values():
+        assert figure._data[0][-2] == 1.0
+        assert figure._data[0][-1] == 2.0
+
+    # Record the telemetry that reaches the labels
+    positions_updated = list()
+    update_labels = widget._update_labels
+
+    def record_update_labels(telemetry: dict) -> None:
+        positions_updated.append(telemetry["positionActual"])
+        update_labels(telemetry)
+
+    widget._update_labels = record_update_labels  # type: ignore[method-assign]
+    widget._timer.start()
+
+    await asyncio.sleep(1)
+
+    # Only the latest frame reaches the labels, and only once without new
+    # telemetry
+    assert positions_updated == [2.0]
+    assert widget._status["position_actual"].text() == "2.00 deg"
+    assert widget._status["drive_torque_actual"][0].text() == "2.00 N*m"
+    assert widget._telemetry is None
+
+
 @pytest.mark.asyncio
 async def test_set_signal_target(widget: TabAzimuth) -> None:
     widget.model.reporter.report_target_azimuth(1.0, 2.0)
@@ -81,3 +81,13 @@ def test_append_data(widget: TabFigure) -> None:
     assert len(widget._figure.get_points(0)) == 200
     assert widget._figure.get_points(0)[-1].y() == 3.0
     assert widget._figure.get_points(1)[-1].y() == 4.0
+
+
+def test_append_data_keep_length(widget: TabFigure) -> None:
+    for value in range(300):
+        widget.append_data([float(value), -float(value)])
+
+    assert len(widget._data[0]) == 200
+    assert widget._data[0][0] == 100.0
+    assert widget._data[0][-1] == 299.0
+    assert widget._data[1][-1] == -299.0
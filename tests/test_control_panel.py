@@ -21,7 +21,6 @@
 
 import asyncio
 import logging
-from copy import deepcopy
 
 import pytest
 from PySide6.QtCore import Qt
@@ -71,7 +70,7 @@ def test_update_button_interlock(widget: ControlPanel) -> None:
 @pytest.mark.asyncio
 async def test_set_signal_interlock(widget: ControlPanel) -> None:
     # Interlocks
-    interlocks = deepcopy(widget.model.reporter.status.interlocks)
+    interlocks = list(widget.model.reporter.status.interlocks)
     interlocks[0] = True
 
     widget.model.reporter.report_interlocks(interlocks)
@@ -91,6 +90,25 @@ async def test_set_signal_interlock(widget: ControlPanel) -> None:
     assert widget._labels["locking_pin"].text() == hex(1)
 
 
+@pytest.mark.asyncio
+async def test_callback_interlock(widget: ControlPanel) -> None:
+    interlocks = [False] * len(widget._interlocks)
+    interlocks[1] = True
+
+    await widget._callback_interlock(interlocks)
+
+    assert widget._interlocks == interlocks
+    assert widget._button_interlock.text() == MTDome.OnOff.ON.name
+    assert widget._tab_interlock._indicators_interlock[1].palette().color(QPalette.Button) == Qt.red
+
+    interlocks[1] = False
+
+    await widget._callback_interlock(interlocks)
+
+    assert widget._button_interlock.text() == MTDome.OnOff.OFF.name
+    assert widget._tab_interlock._indicators_interlock[1].palette().color(QPalette.Button) == Qt.green
+
+
 @pytest.mark.asyncio
 async def test_set_signal_state(widget: ControlPanel) -> None:
     widget.model.reporter.report_state_azimuth_axis(MTDome.EnabledState.ENABLED)
@@ -123,3 +141,18 @@ async def test_set_signal_state(widget: ControlPanel) -> None:
         widget._tab_brake._indicators_brake[idx].palette().color(QPalette.Button) == Qt.yellow
 
     widget._tab_brake._indicators_brake[5].palette().color(QPalette.Button) == Qt.green
+
+
+@pytest.mark.asyncio
+async def test_callback_update_brake_engaged(widget: ControlPanel) -> None:
+    brakes = list(MTDome.Brake)
+    bitmask_first = 1 << brakes[0].value
+    bitmask_second = 1 << brakes[1].value
+
+    await widget._callback_update_brake_engaged(bitmask_first | bitmask_second)
+    await widget._callback_update_brake_engaged(bitmask_second)
+
+    assert widget._button_brake_engaged.text() == hex(bitmask_second)
+
+    assert widget._tab_brake._indicators_brake[0].palette().color(QPalette.Button) == Qt.green
+    assert widget._tab_brake._indicators_brake[1].palette().color(QPalette.Button) == Qt.yellow
@@ -49,15 +49,6 @@ async def model_async() -> Model:
         yield model_sim
 
 
-@pytest_asyncio.fixture
-async def model_async_communication_error() -> Model:
-    async with Model(logging.getLogger(), config_dir=CONFIG_DIR, is_simulation_mode=True) as model_sim:
-        await model_sim.connect()
-        model_sim.communication_error = True
-
-        yield model_sim
-
-
 def test_init(model: Model) -> None:
     assert len(model.connection_information) == 2
 
@@ -86,18 +77,35 @@ async def test_low_level_component_status(qtbot: QtBot, model_async: Model) -> N
 
 
 @pytest.mark.asyncio
-async def test_report_exception_communication_error(
-    qtbot: QtBot, model_async_communication_error: Model
-) -> None:
-    signals = [
-        model_async_communication_error.reporter.signals["fault_code"].aperture_shutter,
-        model_async_communication_error.reporter.signals["fault_code"].elevation_axis,
-        model_async_communication_error.reporter.signals["fault_code"].louvers,
-        model_async_communication_error.reporter.signals["fault_code"].rear_access_door,
-        model_async_communication_error.reporter.signals["fault_code"].calibration_screen,
-    ]
-    with qtbot.waitSignals(signals, timeout=TIMEOUT):
-        await asyncio.sleep(5.0)
+async def test_report_exception_communication_error(qtbot: QtBot, model_async: Model) -> None:
+    # The connection reports the empty fault codes already. Only the changed
+    # fault codes by the communication error should be emitted.
+    llc_names = [LlcName.APSCS, LlcName.LWSCS, LlcName.LCS, LlcName.RAD, LlcName.CSCS]
+    signal_fault_code = model_async.reporter.signals["fault_code"]
+    message = "communication error with the rotating part"
+    with qtbot.waitSignals(
+        [
+            signal_fault_code.aperture_shutter,
+            signal_fault_code.elevation_axis,
+            signal_fault_code.louvers,
+            signal_fault_code.rear_access_door,
+            signal_fault_code.calibration_screen,
+        ],
+        check_params_cbs=[lambda fault_code: fault_code == message] * len(llc_names),
+        timeout=TIMEOUT,
+    ):
+        await asyncio.gather(
+            *[
+                model_async.report_llc_status(
+                    llc_name,
+                    {
+                        "exception": message,
+                        "response_code": ResponseCode.ROTATING_PART_NOT_REPLIED,
+                    },
+                )
+                for llc_name in llc_names
+            ]
+        )
 
 
 @pytest.mark.asyncio
@@ -187,6 +195,9 @@ def test_report_configuration(model: Model) -> None:
     assert status.config_amcs["amax"] == math.degrees(2.0)
     assert status.config_amcs["vmax"] == math.degrees(3.0)
 
+    # The status should not be modified
+    assert data_amcs["appliedConfiguration"]["jmax"] == 1.0
+
     # LWSCS
     data_lwscs = {
         "appliedConfiguration": {
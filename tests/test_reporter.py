@@ -78,13 +78,13 @@ def test_report_default(qtbot: QtBot, reporter: Reporter) -> None:
 
 
 def test_report_interlocks(qtbot: QtBot, reporter: Reporter) -> None:
-    interlocks = deepcopy(reporter.status.interlocks)
+    interlocks = list(reporter.status.interlocks)
     interlocks[0] = True
 
     with qtbot.waitSignal(reporter.signals["interlock"].interlock, timeout=TIMEOUT):
         reporter.report_interlocks(interlocks)
 
-    assert reporter.status.interlocks == interlocks
+    assert reporter.status.interlocks == tuple(interlocks)
 
 
 def test_report_state_locking_pins_engaged(qtbot: QtBot, reporter: Reporter) -> None:
@@ -178,8 +178,10 @@ def test_report_capacitor_bank(qtbot: QtBot, reporter: Reporter) -> None:
     ):
         reporter.report_capacitor_bank(capacitor_bank)
 
+    assert "dcBusVoltage" in capacitor_bank
+
+    capacitor_bank.pop("dcBusVoltage")
     assert reporter.status.capacitor_bank == capacitor_bank
-    assert "dcBusVoltage" not in capacitor_bank
 
 
 def test_report_config_azimuth(qtbot: QtBot, reporter: Reporter) -> None:
@@ -215,6 +217,11 @@ def test_report_target_azimuth(qtbot: QtBot, reporter: Reporter) -> None:
     with qtbot.waitSignal(reporter.signals["target"].position_velocity_azimuth, timeout=TIMEOUT):
         reporter.report_target_azimuth(0.0, 0.0)
 
+    assert reporter.status.targets["position_velocity_azimuth"] == (0.0, 0.0)
+
+    with qtbot.assertNotEmitted(reporter.signals["target"].position_velocity_azimuth):
+        reporter.report_target_azimuth(0.0, 0.0)
+
 
 def test_report_target_elevation(qtbot: QtBot, reporter: Reporter) -> None:
     with qtbot.waitSignal(reporter.signals["target"].position_velocity_elevation, timeout=TIMEOUT):
@@ -238,6 +245,17 @@ def test_report_motion_aperture_shutter(qtbot: QtBot, reporter: Reporter) -> Non
             [True] * APSCS_NUM_SHUTTERS,
         )
 
+    assert reporter.status.motions["aperture_shutter"] == (
+        (MTDome.MotionState.MOVING,) * APSCS_NUM_SHUTTERS,
+        (True,) * APSCS_NUM_SHUTTERS,
+    )
+
+    with qtbot.assertNotEmitted(reporter.signals["motion"].aperture_shutter):
+        reporter.report_motion_aperture_shutter(
+            [MTDome.MotionState.MOVING] * APSCS_NUM_SHUTTERS,
+            [True] * APSCS_NUM_SHUTTERS,
+        )
+
 
 def test_report_motion_louvers(qtbot: QtBot, reporter: Reporter) -> None:
     with qtbot.waitSignal(reporter.signals["motion"].louvers, timeout=TIMEOUT):
@@ -264,6 +282,34 @@ def test_report_fault_code_azimuth_axis(qtbot: QtBot, reporter: Reporter) -> Non
     with qtbot.waitSignal(reporter.signals["fault_code"].azimuth_axis, timeout=TIMEOUT):
         reporter.report_fault_code_azimuth_axis("No error")
 
+    assert reporter.status.fault_codes["azimuth_axis"] == "No error"
+
+    # The same fault code should not be reported again
+    with qtbot.assertNotEmitted(reporter.signals["fault_code"].azimuth_axis):
+        reporter.report_fault_code_azimuth_axis("No error")
+
+
+def test_report_fault_code_error_and_recovery(qtbot: QtBot, reporter: Reporter) -> None:
+    reporter.report_fault_code_azimuth_axis("")
+
+    # Both of the error and the recovery should be reported
+    with qtbot.waitSignals(
+        [
+            reporter.signals["fault_code"].azimuth_axis,
+            reporter.signals["fault_code"].azimuth_axis,
+        ],
+        check_params_cbs=[
+            lambda fault_code: fault_code == "error",
+            lambda fault_code: fault_code == "",
+        ],
+        order="strict",
+        timeout=TIMEOUT,
+    ):
+        reporter.report_fault_code_azimuth_axis("error")
+        reporter.report_fault_code_azimuth_axis("")
+
+    assert reporter.status.fault_codes["azimuth_axis"] == ""
+
 
 def test_report_fault_code_elevation_axis(qtbot: QtBot, reporter: Reporter) -> None:
     with qtbot.waitSignal(reporter.signals["fault_code"].elevation_axis, timeout=TIMEOUT):